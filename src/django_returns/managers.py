@@ -1,8 +1,12 @@
+from functools import lru_cache
+
 from django.db.models import Manager, QuerySet
 from returns.future import future_safe
-from returns.io import impure_safe
+from returns.io import IOFailure, IOSuccess
 from returns.maybe import maybe
-from returns.result import safe
+from returns.result import Failure, Success
+
+from django_returns.utils import _safe_methods, _wrap_methods
 
 
 class BaseReturnsQuerySet(QuerySet):
@@ -10,7 +14,10 @@ class BaseReturnsQuerySet(QuerySet):
     that return Result instead of raising exceptions.
     """
 
-    UNSAFE_METHODS = [
+    # Wrapped methods live on the class; instances gain no extra state.
+    __slots__ = ()
+
+    UNSAFE_METHODS = (
         "get",
         "earliest",
         "latest",
@@ -19,94 +26,116 @@ class BaseReturnsQuerySet(QuerySet):
         "update_or_create",
         "delete",
         "bulk_create",
-    ]
+    )
+
+    # Async counterparts, limited to those the installed Django provides.
+    _ASYNC_METHODS = tuple(
+        "a" + name for name in UNSAFE_METHODS if hasattr(QuerySet, "a" + name)
+    )
 
 
+@_wrap_methods(("first", "last"), maybe, "{}_maybe")
 class MaybeReturnsQuerySet(BaseReturnsQuerySet):
-    """A subclass that includes Maybe-returning methods."""
+    """A subclass that includes Maybe-returning methods.
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for method_name in ["first", "last"]:
-            original_method = getattr(self, method_name)
-            maybe_method = maybe(original_method)
-            setattr(self, method_name, maybe_method)
+    `first()` and `last()` keep their Django semantics,
+    so internal callers don't pay for (or trip over) the Maybe wrapper.
+    """
+
+    __slots__ = ()
 
 
+@_safe_methods(Success, Failure)
 class SafeReturnsQuerySet(MaybeReturnsQuerySet):
     """Experimental: a subclass that overrides unsafe methods
     to return Result instead of raising exceptions.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for method_name in self.UNSAFE_METHODS:
-            original_method = getattr(self, method_name)
-            safe_method = safe(original_method)
-            setattr(self, method_name, safe_method)
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Wrap the unsafe methods a subclass adds or overrides.
+        _safe_methods(Success, Failure)(cls)
 
 
+@_safe_methods(IOSuccess, IOFailure)
 class ImpureReturnsQuerySet(MaybeReturnsQuerySet):
     """Experimental: a subclass that overrides unsafe methods
     to return IOResult instead of raising exceptions.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for method_name in self.UNSAFE_METHODS:
-            original_method = getattr(self, method_name)
-            impure_safe_method = impure_safe(original_method)
-            setattr(self, method_name, impure_safe_method)
+    __slots__ = ()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Wrap the unsafe methods a subclass adds or overrides.
+        _safe_methods(IOSuccess, IOFailure)(cls)
 
-class ExtendedReturnsQuerySet(BaseReturnsQuerySet):
+
+# Sync methods: create both _result and _ioresult variants
+@_safe_methods(Success, Failure, "{}_result")
+@_safe_methods(IOSuccess, IOFailure, "{}_ioresult")
+# Async methods
+@_wrap_methods(BaseReturnsQuerySet._ASYNC_METHODS, future_safe, "{}_ioresult")
+class ExtendedReturnsQuerySet(MaybeReturnsQuerySet):
     """A subclass that includes safe versions (ending with _result or _ioresult)
     of unsafe methods that can be used separately from the original methods."""
 
-    def __init__(
-        self,
-        *args,
-        **kwargs,
-    ):
-        """Dynamically provide safe versions of QuerySet methods."""
-        super().__init__(*args, **kwargs)
+    __slots__ = ()
+
+
+@lru_cache(maxsize=None)
+def _public_attributes(queryset_class):
+    """Names a manager may forward to a QuerySet of `queryset_class`."""
+    return frozenset(name for name in dir(queryset_class) if not name.startswith("_"))
+
+
+def _forward_methods(queryset_class):
+    """Class decorator that adds manager methods for the methods
+    `queryset_class` adds on top of `QuerySet`, like `Manager.from_queryset()`,
+    so they are resolved on the class instead of through `__getattr__`.
+    """
+
+    def decorator(cls):
+        for klass in queryset_class.__mro__[: queryset_class.__mro__.index(QuerySet)]:
+            for name, attr in vars(klass).items():
+                if name.startswith("_") or hasattr(cls, name):
+                    continue
+                if callable(attr):
+                    setattr(cls, name, _manager_method(name))
+        return cls
 
-        for name in BaseReturnsQuerySet.UNSAFE_METHODS:
-            # Sync methods: create both _result and _ioresult variants
-            sync_method = getattr(self, name)
-            setattr(self, name + "_result", safe(sync_method))
-            setattr(self, name + "_ioresult", impure_safe(sync_method))
+    return decorator
 
-            # Async methods
-            async_method = getattr(self, "a" + name)
-            setattr(self, "a" + name + "_ioresult", future_safe(async_method))
 
-    @maybe
-    def first_maybe(self, *args, **kwargs):
-        return self.first(*args, **kwargs)
+def _manager_method(name):
+    def manager_method(self, *args, **kwargs):
+        return getattr(self.get_queryset(), name)(*args, **kwargs)
 
-    @maybe
-    def last_maybe(self, *args, **kwargs):
-        return self.last(*args, **kwargs)
+    manager_method.__name__ = name
+    return manager_method
 
 
+@_forward_methods(ExtendedReturnsQuerySet)
 class ReturnsManager(Manager):
     """Manager that selects a QuerySet according to init params
     and defaults to ExtendedReturnsQuerySet.
     """
 
-    def __init__(
-        self,
-        *args,
-        **kwargs,
-    ):
-        super().__init__(*args, **kwargs)
+    _queryset_class = ExtendedReturnsQuerySet
 
     def get_queryset(self):
-        return ExtendedReturnsQuerySet(self.model, using=self._db)
+        return self._queryset_class(self.model, using=self._db)
 
     def __getattr__(self, name):
-        if name.startswith("_"):
+        if type(self).get_queryset is ReturnsManager.get_queryset:
+            # Reject with a single set lookup instead of building a QuerySet.
+            forwarded = name in _public_attributes(self._queryset_class)
+        else:
+            # A custom get_queryset() may return any QuerySet class.
+            forwarded = not name.startswith("_")
+        if not forwarded:
             raise AttributeError(
                 f"'{type(self).__name__}' object has no attribute '{name}'"
             )
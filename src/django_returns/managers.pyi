@@ -18,9 +18,14 @@ MatchIOResult: TypeAlias = IOSuccess[_Value] | IOFailure[_Error]
 class BaseReturnsQuerySet(QuerySet[_M]):
     """Base QuerySet with list of unsafe methods."""
 
-    UNSAFE_METHODS: list[str]
+    UNSAFE_METHODS: tuple[str, ...]
 
-class ExtendedReturnsQuerySet(BaseReturnsQuerySet[_M]):
+class MaybeReturnsQuerySet(BaseReturnsQuerySet[_M]):
+    """A subclass that includes Maybe-returning methods."""
+    def first_maybe(self, *args, **kwargs) -> Maybe[_M]: ...
+    def last_maybe(self, *args, **kwargs) -> Maybe[_M]: ...
+
+class ExtendedReturnsQuerySet(MaybeReturnsQuerySet[_M]):
     """A subclass that includes safe versions (ending with _result or _ioresult)
     of unsafe methods that can be used separately from the original methods.
     """
@@ -82,10 +87,6 @@ class ExtendedReturnsQuerySet(BaseReturnsQuerySet[_M]):
         self, *args, **kwargs
     ) -> FutureResult[list[_M], Exception]: ...
 
-    # Maybe methods
-    def first_maybe(self, *args, **kwargs) -> Maybe[_M]: ...
-    def last_maybe(self, *args, **kwargs) -> Maybe[_M]: ...
-
 class ReturnsManager(Manager[_M]):
     """Manager that selects a QuerySet according to init params
     and defaults to ExtendedReturnsQuerySet.
@@ -159,11 +160,6 @@ class ReturnsManager(Manager[_M]):
     def first_maybe(self, *args, **kwargs) -> Maybe[_M]: ...
     def last_maybe(self, *args, **kwargs) -> Maybe[_M]: ...
 
-class MaybeReturnsQuerySet(BaseReturnsQuerySet[_M]):
-    """Experimental: a subclass that includes Maybe-returning methods."""
-    def first(self, *args, **kwargs) -> Maybe[_M]: ...
-    def last(self, *args, **kwargs) -> Maybe[_M]: ...
-
 class SafeReturnsQuerySet(MaybeReturnsQuerySet[_M]):
     """Experimental: a subclass that overrides unsafe methods
     to return Result instead of raising exceptions.
@@ -1,22 +1,23 @@
 from django.db import models
-from returns.result import safe
+from returns.result import Failure, Success
 
 from django_returns.managers import ReturnsManager
+from django_returns.utils import _safe_methods
 
 
+@_safe_methods(Success, Failure, "{}_result")
 class ReturnsModel(models.Model):
     """Model base class that provides safe methods via returns."""
 
-    UNSAFE_METHODS = ["save", "delete", "full_clean", "refresh_from_db"]
+    UNSAFE_METHODS = ("save", "delete", "full_clean", "refresh_from_db")
 
     objects = ReturnsManager()
 
     class Meta:
         abstract = True
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for method_name in self.UNSAFE_METHODS:
-            original_method = getattr(self, method_name)
-            safe_method = safe(original_method)
-            setattr(self, f"{method_name}_result", safe_method)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may list their own methods in UNSAFE_METHODS.
+        if "UNSAFE_METHODS" in vars(cls):
+            _safe_methods(Success, Failure, "{}_result")(cls)
@@ -14,6 +14,7 @@ MatchResult: TypeAlias = Success[_Value] | Failure[_Error]
 class ReturnsModel(models.Model):
     """Model base class that provides safe methods via returns."""
 
+    UNSAFE_METHODS: tuple[str, ...]
     objects: ReturnsManager
 
     def save_result(self, *args, **kwargs) -> MatchResult[None, Exception]: ...
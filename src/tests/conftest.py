@@ -0,0 +1,38 @@
+import pytest
+from django.db import transaction
+
+from tests.constants import D2020, D2021
+from tests.models import Author, Book, Person
+
+
+@pytest.fixture(scope="class")
+def people(django_db_setup, django_db_blocker):
+    """Two Person rows shared by the read-only tests of a class.
+
+    Created once per class and rolled back after its last test;
+    each test still runs in its own savepoint inside this transaction.
+    """
+    with django_db_blocker.unblock(), transaction.atomic():
+        people = Person.objects.bulk_create(
+            [
+                Person(name="test1", dob=D2020),
+                Person(name="test2", dob=D2021),
+            ]
+        )
+        yield people
+        transaction.set_rollback(True)
+
+
+@pytest.fixture(scope="class")
+def author_with_books(django_db_setup, django_db_blocker):
+    """An Author with two Books, shared like `people`."""
+    with django_db_blocker.unblock(), transaction.atomic():
+        author = Author.objects.create(name="Jane Austen")
+        books = Book.objects.bulk_create(
+            [
+                Book(title="Pride and Prejudice", author=author),
+                Book(title="Sense and Sensibility", author=author),
+            ]
+        )
+        yield author, books
+        transaction.set_rollback(True)
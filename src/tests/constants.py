@@ -0,0 +1,5 @@
+from datetime import date
+
+D2020 = date(2020, 1, 1)
+D2021 = date(2021, 1, 1)
+D2022 = date(2022, 1, 1)
@@ -1,15 +1,31 @@
 from django.core.exceptions import ValidationError
 from django.db import models
 
-from django_returns.managers import ReturnsManager
+from django_returns.managers import (
+    ExtendedReturnsQuerySet,
+    ImpureReturnsQuerySet,
+    ReturnsManager,
+    SafeReturnsQuerySet,
+)
 from django_returns.models import ReturnsModel
 
 
+class BornAfterQuerySet(ExtendedReturnsQuerySet):
+    def born_after(self, year):
+        return self.filter(dob__year__gt=year)
+
+
+class BornAfterManager(ReturnsManager):
+    def get_queryset(self):
+        return BornAfterQuerySet(self.model, using=self._db)
+
+
 class Person(models.Model):
     name = models.CharField(max_length=100, unique=True)
     dob = models.DateField()
 
     objects = ReturnsManager()
+    born = BornAfterManager()
 
     class Meta:
         app_label = "tests"
@@ -39,3 +55,38 @@ class ValidatedModel(ReturnsModel):
     def clean(self):
         if self.value < 0:
             raise ValidationError("Value cannot be negative")
+
+
+class Document(ReturnsModel):
+    archived = models.BooleanField(default=False)
+
+    UNSAFE_METHODS = (*ReturnsModel.UNSAFE_METHODS, "archive")
+
+    class Meta:
+        app_label = "tests"
+
+    def archive(self):
+        if self.archived:
+            raise ValueError("Document is already archived")
+        self.archived = True
+        self.save()
+
+
+class SafePerson(models.Model):
+    name = models.CharField(max_length=100, unique=True)
+    dob = models.DateField()
+
+    objects = SafeReturnsQuerySet.as_manager()
+
+    class Meta:
+        app_label = "tests"
+
+
+class ImpurePerson(models.Model):
+    name = models.CharField(max_length=100, unique=True)
+    dob = models.DateField()
+
+    objects = ImpureReturnsQuerySet.as_manager()
+
+    class Meta:
+        app_label = "tests"
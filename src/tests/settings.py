@@ -8,6 +8,8 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
+        # Keep connections open across tests instead of reconnecting.
+        "CONN_MAX_AGE": None,
     }
 }
 USE_TZ = True
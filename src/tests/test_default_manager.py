@@ -1,5 +1,3 @@
-from datetime import date
-
 import pytest
 from django.db.utils import IntegrityError
 from returns.io import IOFailure, IOSuccess
@@ -7,20 +5,22 @@ from returns.maybe import Nothing, Some
 from returns.result import Failure, Success
 from returns.unsafe import unsafe_perform_io
 
-from tests.models import Person
+from tests.constants import D2020, D2021, D2022
+from tests.models import BornAfterQuerySet, Person
 
 
 @pytest.mark.django_db
 class TestGetMethods:
-    def test_get_result_success(self):
-        obj = Person.objects.create(name="test", dob=date(2020, 1, 1))
-        result = Person.objects.get_result(name="test")
+    def test_get_result_success(self, people, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            result = Person.objects.get_result(name="test1")
 
         assert isinstance(result, Success)
-        assert result.unwrap() == obj
+        assert result.unwrap() == people[0]
 
-    def test_get_result_failure(self):
-        result = Person.objects.get_result(name="nonexistent")
+    def test_get_result_failure(self, people, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            result = Person.objects.get_result(name="nonexistent")
 
         assert isinstance(result, Failure)
         assert isinstance(result.failure(), Person.DoesNotExist)
@@ -28,30 +28,27 @@ class TestGetMethods:
 
 @pytest.mark.django_db
 class TestEarliestLatestMethods:
-    def test_earliest_result_success(self):
-        obj1 = Person.objects.create(name="test1", dob=date(2020, 1, 1))
-        Person.objects.create(name="test2", dob=date(2021, 1, 1))
-
+    def test_earliest_result_success(self, people):
         result = Person.objects.earliest_result("dob")
 
         assert isinstance(result, Success)
-        assert result.unwrap() == obj1
+        assert result.unwrap() == people[0]
+
+    def test_latest_result_success(self, people):
+        result = Person.objects.latest_result("dob")
+
+        assert isinstance(result, Success)
+        assert result.unwrap() == people[1]
+
 
+@pytest.mark.django_db
+class TestEarliestLatestMethodsEmpty:
     def test_earliest_result_failure(self):
         result = Person.objects.earliest_result("dob")
 
         assert isinstance(result, Failure)
         assert isinstance(result.failure(), Person.DoesNotExist)
 
-    def test_latest_result_success(self):
-        Person.objects.create(name="test1", dob=date(2020, 1, 1))
-        obj2 = Person.objects.create(name="test2", dob=date(2021, 1, 1))
-
-        result = Person.objects.latest_result("dob")
-
-        assert isinstance(result, Success)
-        assert result.unwrap() == obj2
-
     def test_latest_result_failure(self):
         result = Person.objects.latest_result("dob")
 
@@ -61,15 +58,16 @@ class TestEarliestLatestMethods:
 
 @pytest.mark.django_db
 class TestCreateMethods:
-    def test_create_result_success(self):
-        result = Person.objects.create_result(name="test", dob=date(2020, 1, 1))
+    def test_create_result_success(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            result = Person.objects.create_result(name="test", dob=D2020)
 
         assert isinstance(result, Success)
-        assert Person.objects.count() == 1
+        assert result.unwrap().pk is not None
 
     def test_create_result_failure(self):
-        Person.objects.create(name="test", dob=date(2020, 1, 1))
-        result = Person.objects.create_result(name="test", dob=date(2021, 1, 1))
+        Person.objects.create(name="test", dob=D2020)
+        result = Person.objects.create_result(name="test", dob=D2021)
 
         assert isinstance(result, Failure)
         assert isinstance(result.failure(), IntegrityError)
@@ -77,11 +75,12 @@ class TestCreateMethods:
 
 @pytest.mark.django_db
 class TestGetOrCreateMethods:
-    def test_get_or_create_result_get(self):
-        existing = Person.objects.create(name="test", dob=date(2020, 1, 1))
-        result = Person.objects.get_or_create_result(
-            name="test", defaults={"dob": date(2021, 1, 1)}
-        )
+    def test_get_or_create_result_get(self, django_assert_num_queries):
+        existing = Person.objects.create(name="test", dob=D2020)
+        with django_assert_num_queries(1):
+            result = Person.objects.get_or_create_result(
+                name="test", defaults={"dob": D2021}
+            )
 
         assert isinstance(result, Success)
         obj, created = result.unwrap()
@@ -90,7 +89,7 @@ class TestGetOrCreateMethods:
 
     def test_get_or_create_result_create(self):
         result = Person.objects.get_or_create_result(
-            name="test", defaults={"dob": date(2020, 1, 1)}
+            name="test", defaults={"dob": D2020}
         )
 
         assert isinstance(result, Success)
@@ -101,19 +100,19 @@ class TestGetOrCreateMethods:
 @pytest.mark.django_db
 class TestUpdateOrCreateMethods:
     def test_update_or_create_result_update(self):
-        _ = Person.objects.create(name="test", dob=date(2020, 1, 1))
+        Person.objects.create(name="test", dob=D2020)
         result = Person.objects.update_or_create_result(
-            name="test", defaults={"dob": date(2021, 1, 1)}
+            name="test", defaults={"dob": D2021}
         )
 
         assert isinstance(result, Success)
         obj, created = result.unwrap()
-        assert obj.dob == date(2021, 1, 1)
+        assert obj.dob == D2021
         assert created is False
 
     def test_update_or_create_result_create(self):
         result = Person.objects.update_or_create_result(
-            name="test", defaults={"dob": date(2020, 1, 1)}
+            name="test", defaults={"dob": D2020}
         )
 
         assert isinstance(result, Success)
@@ -123,55 +122,72 @@ class TestUpdateOrCreateMethods:
 
 @pytest.mark.django_db
 class TestDeleteMethods:
-    def test_delete_result_success(self):
-        Person.objects.create(name="test1", dob=date(2020, 1, 1))
-        Person.objects.create(name="test2", dob=date(2021, 1, 1))
+    def test_delete_result_success(self, django_assert_num_queries):
+        Person.objects.bulk_create(
+            [
+                Person(name="test1", dob=D2020),
+                Person(name="test2", dob=D2021),
+            ]
+        )
 
-        result = Person.objects.filter(name="test1").delete_result()
+        with django_assert_num_queries(1):
+            result = Person.objects.filter(name="test1").delete_result()
 
         assert isinstance(result, Success)
-        assert Person.objects.count() == 1
+        deleted_count, _ = result.unwrap()
+        assert deleted_count == 1
+        assert Person.objects.filter(name="test2").exists()
 
 
 @pytest.mark.django_db
 class TestBulkCreateMethods:
-    def test_bulk_create_result_success(self):
+    def test_bulk_create_result_success(self, django_assert_num_queries):
         objects = [
-            Person(name="test1", dob=date(2020, 1, 1)),
-            Person(name="test2", dob=date(2021, 1, 1)),
+            Person(name="test1", dob=D2020),
+            Person(name="test2", dob=D2021),
         ]
 
-        result = Person.objects.bulk_create_result(objects)
+        with django_assert_num_queries(1):
+            result = Person.objects.bulk_create_result(objects)
+
+        assert isinstance(result, Success)
+        assert all(obj.pk is not None for obj in result.unwrap())
+
+    def test_bulk_create_result_batch_size(self, django_assert_num_queries):
+        objects = [Person(name=f"test{i}", dob=D2020) for i in range(1000)]
+
+        with django_assert_num_queries(10):
+            result = Person.objects.bulk_create_result(objects, batch_size=100)
 
         assert isinstance(result, Success)
-        assert Person.objects.count() == 2
+        assert len(result.unwrap()) == 1000
 
     def test_bulk_create_result_failure(self):
-        Person.objects.create(name="test1", dob=date(2020, 1, 1))
+        Person.objects.create(name="test1", dob=D2020)
         objects = [
-            Person(name="test1", dob=date(2020, 1, 1)),  # Duplicate
-            Person(name="test2", dob=date(2021, 1, 1)),
+            Person(name="test1", dob=D2020),  # Duplicate
+            Person(name="test2", dob=D2021),
         ]
 
         result = Person.objects.bulk_create_result(objects)
 
         assert isinstance(result, Failure)
+        assert isinstance(result.failure(), IntegrityError)
 
 
 @pytest.mark.django_db
-class TestSyncIOResultMethods:
-    """Test sync methods that return IOResult (using impure_safe)."""
+class TestSyncIOResultReadMethods:
+    """Test sync read methods that return IOResult (using impure_safe)."""
 
-    def test_get_ioresult_success(self):
-        obj = Person.objects.create(name="io_test", dob=date(2020, 1, 1))
-        io_result = Person.objects.get_ioresult(name="io_test")
+    def test_get_ioresult_success(self, people):
+        io_result = Person.objects.get_ioresult(name="test1")
 
         assert isinstance(io_result, IOSuccess)
         result = unsafe_perform_io(io_result)
         assert isinstance(result, Success)
-        assert result.unwrap() == obj
+        assert result.unwrap() == people[0]
 
-    def test_get_ioresult_failure(self):
+    def test_get_ioresult_failure(self, people):
         io_result = Person.objects.get_ioresult(name="nonexistent")
 
         assert isinstance(io_result, IOFailure)
@@ -179,64 +195,65 @@ class TestSyncIOResultMethods:
         assert isinstance(result, Failure)
         assert isinstance(result.failure(), Person.DoesNotExist)
 
-    def test_create_ioresult_success(self):
-        io_result = Person.objects.create_ioresult(
-            name="io_create", dob=date(2020, 1, 1)
-        )
+    def test_earliest_ioresult_success(self, people):
+        io_result = Person.objects.earliest_ioresult("dob")
 
         assert isinstance(io_result, IOSuccess)
         result = unsafe_perform_io(io_result)
-        assert isinstance(result, Success)
-        obj = result.unwrap()
-        assert obj.name == "io_create"
-        assert Person.objects.count() == 1
+        assert result.unwrap() == people[0]
 
-    def test_create_ioresult_failure(self):
-        Person.objects.create(name="duplicate", dob=date(2020, 1, 1))
-        io_result = Person.objects.create_ioresult(
-            name="duplicate", dob=date(2021, 1, 1)
-        )
+    def test_latest_ioresult_success(self, people):
+        io_result = Person.objects.latest_ioresult("dob")
 
-        assert isinstance(io_result, IOFailure)
+        assert isinstance(io_result, IOSuccess)
         result = unsafe_perform_io(io_result)
-        assert isinstance(result, Failure)
-        assert isinstance(result.failure(), IntegrityError)
+        assert result.unwrap() == people[1]
 
-    def test_earliest_ioresult_success(self):
-        obj1 = Person.objects.create(name="io_earliest1", dob=date(2020, 1, 1))
-        Person.objects.create(name="io_earliest2", dob=date(2021, 1, 1))
 
-        io_result = Person.objects.earliest_ioresult("dob")
+@pytest.mark.django_db
+class TestSyncIOResultMethods:
+    """Test sync methods that return IOResult (using impure_safe)."""
+
+    def test_create_ioresult_success(self):
+        io_result = Person.objects.create_ioresult(name="io_create", dob=D2020)
 
         assert isinstance(io_result, IOSuccess)
         result = unsafe_perform_io(io_result)
-        assert result.unwrap() == obj1
-
-    def test_latest_ioresult_success(self):
-        Person.objects.create(name="io_latest1", dob=date(2020, 1, 1))
-        obj2 = Person.objects.create(name="io_latest2", dob=date(2021, 1, 1))
+        assert isinstance(result, Success)
+        obj = result.unwrap()
+        assert obj.name == "io_create"
+        assert obj.pk is not None
 
-        io_result = Person.objects.latest_ioresult("dob")
+    def test_create_ioresult_failure(self):
+        Person.objects.create(name="duplicate", dob=D2020)
+        io_result = Person.objects.create_ioresult(name="duplicate", dob=D2021)
 
-        assert isinstance(io_result, IOSuccess)
+        assert isinstance(io_result, IOFailure)
         result = unsafe_perform_io(io_result)
-        assert result.unwrap() == obj2
+        assert isinstance(result, Failure)
+        assert isinstance(result.failure(), IntegrityError)
 
     def test_delete_ioresult_success(self):
-        Person.objects.create(name="io_delete1", dob=date(2020, 1, 1))
-        Person.objects.create(name="io_delete2", dob=date(2021, 1, 1))
+        Person.objects.bulk_create(
+            [
+                Person(name="io_delete1", dob=D2020),
+                Person(name="io_delete2", dob=D2021),
+            ]
+        )
 
         io_result = Person.objects.filter(name="io_delete1").delete_ioresult()
 
         assert isinstance(io_result, IOSuccess)
         result = unsafe_perform_io(io_result)
         assert isinstance(result, Success)
-        assert Person.objects.count() == 1
+        deleted_count, _ = result.unwrap()
+        assert deleted_count == 1
+        assert Person.objects.filter(name="io_delete2").exists()
 
     def test_bulk_create_ioresult_success(self):
         objects = [
-            Person(name="io_bulk1", dob=date(2020, 1, 1)),
-            Person(name="io_bulk2", dob=date(2021, 1, 1)),
+            Person(name="io_bulk1", dob=D2020),
+            Person(name="io_bulk2", dob=D2021),
         ]
 
         io_result = Person.objects.bulk_create_ioresult(objects)
@@ -244,116 +261,122 @@ class TestSyncIOResultMethods:
         assert isinstance(io_result, IOSuccess)
         result = unsafe_perform_io(io_result)
         assert isinstance(result, Success)
-        assert Person.objects.count() == 2
+        assert all(obj.pk is not None for obj in result.unwrap())
 
 
 @pytest.mark.django_db
 class TestMaybeMethods:
-    def test_first_maybe_some(self):
-        obj1 = Person.objects.create(name="test1", dob=date(2020, 1, 1))
-        Person.objects.create(name="test2", dob=date(2021, 1, 1))
-
-        result = Person.objects.first_maybe()
+    @pytest.mark.parametrize(
+        ("method", "index"), [("first_maybe", 0), ("last_maybe", 1)]
+    )
+    def test_maybe_some(self, people, method, index):
+        result = getattr(Person.objects, method)()
 
         assert isinstance(result, Some)
-        assert result.unwrap() == obj1
+        assert result.unwrap() == people[index]
+
+    def test_maybe_keeps_deferred_fields(self, people, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            result = Person.objects.only("pk").first_maybe()
 
-    def test_first_maybe_nothing(self):
-        result = Person.objects.first_maybe()
+        assert result.unwrap() == people[0]
+        assert result.unwrap().get_deferred_fields() == {"name", "dob"}
+
+
+@pytest.mark.django_db
+class TestMaybeMethodsEmpty:
+    @pytest.mark.parametrize("method", ["first_maybe", "last_maybe"])
+    def test_maybe_nothing(self, method):
+        result = getattr(Person.objects, method)()
 
         assert result == Nothing
 
-    def test_last_maybe_some(self):
-        Person.objects.create(name="test1", dob=date(2020, 1, 1))
-        obj2 = Person.objects.create(name="test2", dob=date(2021, 1, 1))
 
-        result = Person.objects.last_maybe()
+@pytest.mark.django_db
+class TestAsyncIOResultMethodsEmpty:
+    """Async reads against an empty table.
 
-        assert isinstance(result, Some)
-        assert result.unwrap() == obj2
+    Async ORM calls run on another thread and connection, outside the
+    test transaction, so only tests that write need `transaction=True`.
+    """
 
-    def test_last_maybe_nothing(self):
-        result = Person.objects.last_maybe()
+    async def test_aget_ioresult_failure(self):
+        result = await Person.objects.aget_ioresult(name="nonexistent")
 
-        assert result == Nothing
+        assert isinstance(result, IOFailure)
+        assert isinstance(unsafe_perform_io(result).failure(), Person.DoesNotExist)
+
+    async def test_aearliest_ioresult_failure(self):
+        result = await Person.objects.aearliest_ioresult("dob")
+
+        assert isinstance(result, IOFailure)
+
+    async def test_alatest_ioresult_failure(self):
+        result = await Person.objects.alatest_ioresult("dob")
+
+        assert isinstance(result, IOFailure)
 
 
 @pytest.mark.django_db(transaction=True)
-@pytest.mark.asyncio
 class TestAsyncIOResultMethods:
     """Test async methods that return FutureResult -> IOResult (using future_safe)."""
 
     async def test_aget_ioresult_success(self):
-        obj = await Person.objects.acreate(name="async_test", dob=date(2020, 1, 1))
+        obj = await Person.objects.acreate(name="async_test", dob=D2020)
         result = await Person.objects.aget_ioresult(name="async_test")
 
         assert isinstance(result, IOSuccess)
         assert unsafe_perform_io(result).unwrap() == obj
 
-    async def test_aget_ioresult_failure(self):
-        result = await Person.objects.aget_ioresult(name="nonexistent")
-
-        assert isinstance(result, IOFailure)
-        assert isinstance(unsafe_perform_io(result).failure(), Person.DoesNotExist)
-
     async def test_aearliest_ioresult_success(self):
-        obj1 = await Person.objects.acreate(
-            name="async_earliest1", dob=date(2020, 1, 1)
+        obj1, _ = await Person.objects.abulk_create(
+            [
+                Person(name="async_earliest1", dob=D2020),
+                Person(name="async_earliest2", dob=D2021),
+            ]
         )
-        await Person.objects.acreate(name="async_earliest2", dob=date(2021, 1, 1))
 
         result = await Person.objects.aearliest_ioresult("dob")
 
         assert isinstance(result, IOSuccess)
         assert unsafe_perform_io(result).unwrap() == obj1
 
-    async def test_aearliest_ioresult_failure(self):
-        result = await Person.objects.aearliest_ioresult("dob")
-
-        assert isinstance(result, IOFailure)
-
     async def test_alatest_ioresult_success(self):
-        await Person.objects.acreate(name="async_latest1", dob=date(2020, 1, 1))
-        obj2 = await Person.objects.acreate(name="async_latest2", dob=date(2021, 1, 1))
+        _, obj2 = await Person.objects.abulk_create(
+            [
+                Person(name="async_latest1", dob=D2020),
+                Person(name="async_latest2", dob=D2021),
+            ]
+        )
 
         result = await Person.objects.alatest_ioresult("dob")
 
         assert isinstance(result, IOSuccess)
         assert unsafe_perform_io(result).unwrap() == obj2
 
-    async def test_alatest_ioresult_failure(self):
-        result = await Person.objects.alatest_ioresult("dob")
-
-        assert isinstance(result, IOFailure)
-
 
 @pytest.mark.django_db(transaction=True)
-@pytest.mark.asyncio
 class TestAsyncCreateMethods:
     async def test_acreate_ioresult_success(self):
-        result = await Person.objects.acreate_ioresult(
-            name="async_create", dob=date(2020, 1, 1)
-        )
+        result = await Person.objects.acreate_ioresult(name="async_create", dob=D2020)
 
         assert isinstance(result, IOSuccess)
         obj = unsafe_perform_io(result).unwrap()
         assert obj.name == "async_create"
 
     async def test_acreate_ioresult_failure(self):
-        await Person.objects.acreate(name="duplicate_async", dob=date(2020, 1, 1))
+        await Person.objects.acreate(name="duplicate_async", dob=D2020)
         result = await Person.objects.acreate_ioresult(
-            name="duplicate_async", dob=date(2021, 1, 1)
+            name="duplicate_async", dob=D2021
         )
 
         assert isinstance(result, IOFailure)
         assert isinstance(unsafe_perform_io(result).failure(), IntegrityError)
 
     async def test_aget_or_create_ioresult_get(self):
-        existing = await Person.objects.acreate(
-            name="existing_async", dob=date(2020, 1, 1)
-        )
+        existing = await Person.objects.acreate(name="existing_async", dob=D2020)
         result = await Person.objects.aget_or_create_ioresult(
-            name="existing_async", defaults={"dob": date(2021, 1, 1)}
+            name="existing_async", defaults={"dob": D2021}
         )
 
         assert isinstance(result, IOSuccess)
@@ -363,7 +386,7 @@ class TestAsyncCreateMethods:
 
     async def test_aget_or_create_ioresult_create(self):
         result = await Person.objects.aget_or_create_ioresult(
-            name="new_async", defaults={"dob": date(2020, 1, 1)}
+            name="new_async", defaults={"dob": D2020}
         )
 
         assert isinstance(result, IOSuccess)
@@ -372,22 +395,20 @@ class TestAsyncCreateMethods:
         assert created is True
 
     async def test_aupdate_or_create_ioresult_update(self):
-        existing = await Person.objects.acreate(
-            name="update_me_async", dob=date(2020, 1, 1)
-        )
+        existing = await Person.objects.acreate(name="update_me_async", dob=D2020)
         result = await Person.objects.aupdate_or_create_ioresult(
-            name="update_me_async", defaults={"dob": date(2021, 1, 1)}
+            name="update_me_async", defaults={"dob": D2021}
         )
 
         assert isinstance(result, IOSuccess)
         obj, created = unsafe_perform_io(result).unwrap()
         assert obj.id == existing.id
-        assert obj.dob == date(2021, 1, 1)
+        assert obj.dob == D2021
         assert created is False
 
     async def test_aupdate_or_create_ioresult_create(self):
         result = await Person.objects.aupdate_or_create_ioresult(
-            name="create_new_async", defaults={"dob": date(2020, 1, 1)}
+            name="create_new_async", defaults={"dob": D2020}
         )
 
         assert isinstance(result, IOSuccess)
@@ -396,8 +417,12 @@ class TestAsyncCreateMethods:
         assert created is True
 
     async def test_adelete_ioresult_success(self):
-        await Person.objects.acreate(name="delete1_async", dob=date(2020, 1, 1))
-        await Person.objects.acreate(name="delete2_async", dob=date(2021, 1, 1))
+        await Person.objects.abulk_create(
+            [
+                Person(name="delete1_async", dob=D2020),
+                Person(name="delete2_async", dob=D2021),
+            ]
+        )
 
         result = await Person.objects.filter(name="delete1_async").adelete_ioresult()
         assert isinstance(result, IOSuccess)
@@ -406,9 +431,9 @@ class TestAsyncCreateMethods:
 
     async def test_abulk_create_ioresult_success(self):
         objects = [
-            Person(name="bulk1_async", dob=date(2020, 1, 1)),
-            Person(name="bulk2_async", dob=date(2021, 1, 1)),
-            Person(name="bulk3_async", dob=date(2022, 1, 1)),
+            Person(name="bulk1_async", dob=D2020),
+            Person(name="bulk2_async", dob=D2021),
+            Person(name="bulk3_async", dob=D2022),
         ]
 
         result = await Person.objects.abulk_create_ioresult(objects)
@@ -418,13 +443,48 @@ class TestAsyncCreateMethods:
         assert len(created) == 3
 
     async def test_abulk_create_ioresult_failure(self):
-        await Person.objects.acreate(name="bulk1_fail_async", dob=date(2020, 1, 1))
+        await Person.objects.acreate(name="bulk1_fail_async", dob=D2020)
         objects = [
-            Person(name="bulk1_fail_async", dob=date(2020, 1, 1)),  # Duplicate
-            Person(name="bulk2_fail_async", dob=date(2021, 1, 1)),
+            Person(name="bulk1_fail_async", dob=D2020),  # Duplicate
+            Person(name="bulk2_fail_async", dob=D2021),
         ]
 
         result = await Person.objects.abulk_create_ioresult(objects)
 
         assert isinstance(result, IOFailure)
         assert isinstance(unsafe_perform_io(result).failure(), IntegrityError)
+
+
+@pytest.mark.django_db
+class TestQuerySetState:
+    def test_wrappers_are_not_stored_on_instances(self):
+        qs = Person.objects.filter(name="test")
+        qs.get_result()
+        qs.get_ioresult()
+        qs.first_maybe()
+
+        assert not any(
+            name.endswith(("_result", "_ioresult", "_maybe")) for name in vars(qs)
+        )
+
+
+class TestManagerAttributes:
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            Person.objects.nonexistent_result  # noqa: B018
+
+    def test_private_attribute(self):
+        with pytest.raises(AttributeError):
+            Person.objects._nonexistent  # noqa: B018
+
+    def test_unknown_attribute_does_not_build_queryset(self, monkeypatch):
+        def get_queryset(self):
+            raise AssertionError("get_queryset should not be called")
+
+        monkeypatch.setattr(type(Person.objects), "get_queryset", get_queryset)
+
+        assert not hasattr(Person.objects, "nonexistent_result")
+        assert not hasattr(Person.objects, "contribute_to_related_class")
+
+    def test_custom_get_queryset_methods(self):
+        assert isinstance(Person.born.born_after(2020), BornAfterQuerySet)
@@ -1,10 +1,13 @@
+import pickle
+
 import pytest
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from django.db.models import ProtectedError
 from returns.result import Failure, Success
 
-from tests.models import Author, Book, ValidatedModel
+from django_returns.models import ReturnsModel
+from tests.models import Author, Book, Document, ValidatedModel
 
 
 @pytest.mark.django_db
@@ -15,7 +18,6 @@ class TestSaveSafe:
 
         assert isinstance(result, Success)
         assert author.pk is not None
-        assert Author.objects.count() == 1
 
     def test_save_result_integrity_error(self):
         Author.objects.create(name="Duplicate")
@@ -30,19 +32,20 @@ class TestSaveSafe:
         result = model.save_result()
 
         assert isinstance(result, Success)
-        assert ValidatedModel.objects.count() == 1
+        assert model.pk is not None
 
 
 @pytest.mark.django_db
 class TestDeleteSafe:
     def test_delete_result_success(self):
         author = Author.objects.create(name="Test Author")
+        author_pk = author.pk
         result = author.delete_result()
 
         assert isinstance(result, Success)
         deleted_count, _ = result.unwrap()
         assert deleted_count == 1
-        assert Author.objects.count() == 0
+        assert not Author.objects.filter(pk=author_pk).exists()
 
     def test_delete_result_protected_error(self):
         author = Author.objects.create(name="Test Author")
@@ -52,7 +55,7 @@ class TestDeleteSafe:
 
         assert isinstance(result, Failure)
         assert isinstance(result.failure(), ProtectedError)
-        assert Author.objects.count() == 1
+        assert Author.objects.filter(pk=author.pk).exists()
 
 
 @pytest.mark.django_db
@@ -110,3 +113,44 @@ class TestRefreshFromDbSafe:
 
         assert isinstance(result, Failure)
         # The error type depends on Django version, but it should be a failure
+
+
+@pytest.mark.django_db
+class TestSafeMethodsOnClass:
+    def test_instance_is_picklable(self):
+        author = Author.objects.create(name="Pickled")
+        restored = pickle.loads(pickle.dumps(author))
+
+        assert restored == author
+        assert isinstance(restored.refresh_from_db_result(), Success)
+
+    def test_unknown_result_attribute(self, django_assert_num_queries):
+        book = Book.objects.create(
+            title="Test Book", author=Author.objects.create(name="Test")
+        )
+        book = Book.objects.get(pk=book.pk)
+
+        with django_assert_num_queries(0):
+            assert not hasattr(book, "author_result")
+
+
+@pytest.mark.django_db
+class TestSubclassUnsafeMethods:
+    def test_added_method_success(self):
+        document = Document.objects.create()
+        result = document.archive_result()
+
+        assert isinstance(result, Success)
+        assert document.archived is True
+
+    def test_added_method_failure(self):
+        result = Document(archived=True).archive_result()
+
+        assert isinstance(result, Failure)
+        assert isinstance(result.failure(), ValueError)
+
+    def test_inherited_methods_are_kept(self):
+        result = Document().save_result()
+
+        assert isinstance(result, Success)
+        assert Document.save_result is ReturnsModel.save_result
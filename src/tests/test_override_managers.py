@@ -0,0 +1,132 @@
+import pytest
+from django.db.utils import IntegrityError
+from returns.io import IOFailure, IOSuccess
+from returns.maybe import Nothing, Some
+from returns.result import Failure, Success
+from returns.unsafe import unsafe_perform_io
+
+from django_returns.managers import ImpureReturnsQuerySet, SafeReturnsQuerySet
+from tests.constants import D2020, D2021
+from tests.models import ImpurePerson, SafePerson
+
+
+class OldestSafeQuerySet(SafeReturnsQuerySet):
+    UNSAFE_METHODS = (*SafeReturnsQuerySet.UNSAFE_METHODS, "oldest")
+
+    def oldest(self):
+        return self.order_by("dob")[0]
+
+
+class RaisingGetSafeQuerySet(SafeReturnsQuerySet):
+    def get(self, *args, **kwargs):
+        raise ValueError("get is disabled")
+
+
+class DelegatingGetSafeQuerySet(SafeReturnsQuerySet):
+    def get(self, *args, **kwargs):
+        return super().get(*args, **kwargs)
+
+
+def test_queryset_class_is_not_rebuilt_per_call():
+    assert type(SafePerson.objects.all()) is SafeReturnsQuerySet
+    assert type(ImpurePerson.objects.all()) is ImpureReturnsQuerySet
+
+
+@pytest.mark.django_db
+class TestSafeReturnsQuerySet:
+    def test_get_success(self):
+        obj = SafePerson.objects.create(name="test", dob=D2020).unwrap()
+        result = SafePerson.objects.get(name="test")
+
+        assert isinstance(result, Success)
+        assert result.unwrap() == obj
+
+    def test_get_failure(self):
+        result = SafePerson.objects.get(name="nonexistent")
+
+        assert isinstance(result, Failure)
+        assert isinstance(result.failure(), SafePerson.DoesNotExist)
+
+    def test_create_failure(self):
+        SafePerson.objects.create(name="test", dob=D2020)
+        result = SafePerson.objects.create(name="test", dob=D2021)
+
+        assert isinstance(result, Failure)
+        assert isinstance(result.failure(), IntegrityError)
+
+    def test_chained_get(self):
+        _, obj2 = SafePerson.objects.bulk_create(
+            [
+                SafePerson(name="test1", dob=D2020),
+                SafePerson(name="test2", dob=D2021),
+            ]
+        ).unwrap()
+
+        result = SafePerson.objects.filter(dob__year=2021).get()
+
+        assert isinstance(result, Success)
+        assert result.unwrap() == obj2
+
+    def test_first_maybe_some(self):
+        obj = SafePerson.objects.create(name="test", dob=D2020).unwrap()
+        result = SafePerson.objects.all().first_maybe()
+
+        assert isinstance(result, Some)
+        assert result.unwrap() == obj
+
+    def test_last_maybe_nothing(self):
+        result = SafePerson.objects.all().last_maybe()
+
+        assert result == Nothing
+
+    def test_first_keeps_django_semantics(self):
+        assert SafePerson.objects.first() is None
+
+    def test_subclass_added_method_success(self):
+        obj = SafePerson.objects.create(name="test", dob=D2020).unwrap()
+        result = OldestSafeQuerySet(SafePerson).oldest()
+
+        assert isinstance(result, Success)
+        assert result.unwrap() == obj
+
+    def test_subclass_added_method_failure(self):
+        result = OldestSafeQuerySet(SafePerson).oldest()
+
+        assert isinstance(result, Failure)
+        assert isinstance(result.failure(), IndexError)
+
+    def test_subclass_overridden_method(self):
+        result = RaisingGetSafeQuerySet(SafePerson).get()
+
+        assert isinstance(result, Failure)
+        assert isinstance(result.failure(), ValueError)
+
+    def test_subclass_override_calling_super(self):
+        result = DelegatingGetSafeQuerySet(SafePerson).get(name="nonexistent")
+
+        assert isinstance(result, Failure)
+        assert isinstance(result.failure(), SafePerson.DoesNotExist)
+
+    def test_subclass_keeps_inherited_overrides(self):
+        result = OldestSafeQuerySet(SafePerson).get(name="nonexistent")
+
+        assert isinstance(result, Failure)
+        assert isinstance(result.failure(), SafePerson.DoesNotExist)
+
+
+@pytest.mark.django_db
+class TestImpureReturnsQuerySet:
+    def test_get_success(self):
+        io_obj = ImpurePerson.objects.create(name="test", dob=D2020)
+        obj = unsafe_perform_io(io_obj).unwrap()
+        io_result = ImpurePerson.objects.get(name="test")
+
+        assert isinstance(io_result, IOSuccess)
+        assert unsafe_perform_io(io_result).unwrap() == obj
+
+    def test_get_failure(self):
+        io_result = ImpurePerson.objects.get(name="nonexistent")
+
+        assert isinstance(io_result, IOFailure)
+        result = unsafe_perform_io(io_result)
+        assert isinstance(result.failure(), ImpurePerson.DoesNotExist)
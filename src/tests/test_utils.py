@@ -1,29 +1,36 @@
 import pytest
+from returns.io import IOFailure, IOSuccess
 from returns.result import Failure, Success
 
-from django_returns.utils import getattr_safe
+from django_returns.utils import getattr_safe, unsafe_perform_io
 from tests.models import Author, Book
 
 
 @pytest.mark.django_db
 class TestGetAttrSafeWithForeignKeys:
-    def test_getattr_safe_existing_fk(self):
+    def test_getattr_safe_existing_fk(self, author_with_books):
         """Access an existing foreign key relationship."""
-        author = Author.objects.create(name="Jane Austen")
-        book = Book.objects.create(title="Pride and Prejudice", author=author)
+        author, (book, _) = author_with_books
 
         result = getattr_safe(book, "author")
 
         assert isinstance(result, Success)
         assert result.unwrap() == author
 
-    def test_getattr_safe_chained_fk(self):
-        """Chain multiple FK accesses."""
-        author = Author.objects.create(name="Jane Austen")
-        book = Book.objects.create(title="Pride and Prejudice", author=author)
+    @pytest.mark.parametrize("select_related", [False, True])
+    def test_getattr_safe_chained_fk(
+        self, author_with_books, select_related, django_assert_num_queries
+    ):
+        """Chain multiple FK accesses, using the cache select_related fills."""
+        author, (book, _) = author_with_books
+        books = (
+            Book.objects.select_related("author") if select_related else Book.objects
+        )
+        book = books.get(pk=book.pk)
 
         # Access book.author
-        result1 = getattr_safe(book, "author")
+        with django_assert_num_queries(0 if select_related else 1):
+            result1 = getattr_safe(book, "author")
         assert isinstance(result1, Success)
         assert result1.unwrap() == author
 
@@ -32,29 +39,27 @@ class TestGetAttrSafeWithForeignKeys:
         assert isinstance(result2, Success)
         assert result2.unwrap() == "Jane Austen"
 
-    def test_getattr_safe_invalid_attribute(self):
+    def test_getattr_safe_invalid_attribute(self, author_with_books):
         """Access a non-existent attribute."""
-        author = Author.objects.create(name="Jane Austen")
+        author, _ = author_with_books
 
         result = getattr_safe(author, "nonexistent_field")
 
         assert isinstance(result, Failure)
         assert isinstance(result.failure(), AttributeError)
 
-    def test_getattr_safe_regular_field(self):
+    def test_getattr_safe_regular_field(self, author_with_books):
         """Access a regular field (not FK)."""
-        author = Author.objects.create(name="Jane Austen")
+        author, _ = author_with_books
 
         result = getattr_safe(author, "name")
 
         assert isinstance(result, Success)
         assert result.unwrap() == "Jane Austen"
 
-    def test_getattr_safe_reverse_relation(self):
+    def test_getattr_safe_reverse_relation(self, author_with_books):
         """Access reverse FK relationship (returns manager)."""
-        author = Author.objects.create(name="Jane Austen")
-        Book.objects.create(title="Pride and Prejudice", author=author)
-        Book.objects.create(title="Sense and Sensibility", author=author)
+        author, _ = author_with_books
 
         result = getattr_safe(author, "books")
 
@@ -63,20 +68,48 @@ class TestGetAttrSafeWithForeignKeys:
         manager = result.unwrap()
         assert manager.count() == 2
 
-    def test_getattr_safe_pk_field(self):
+    def test_getattr_safe_prefetched_reverse_relation(
+        self, author_with_books, django_assert_num_queries
+    ):
+        """The returned manager serves prefetched objects without querying."""
+        author, books = author_with_books
+        author = Author.objects.prefetch_related("books").get(pk=author.pk)
+
+        result = getattr_safe(author, "books")
+
+        assert isinstance(result, Success)
+        with django_assert_num_queries(0):
+            assert set(result.unwrap().all()) == set(books)
+
+    def test_getattr_safe_pk_field(self, author_with_books):
         """Access primary key field."""
-        author = Author.objects.create(name="Jane Austen")
+        author, _ = author_with_books
 
         result = getattr_safe(author, "pk")
 
         assert isinstance(result, Success)
         assert result.unwrap() == author.pk
 
-    def test_getattr_safe_id_field(self):
+    def test_getattr_safe_id_field(self, author_with_books):
         """Access id field."""
-        author = Author.objects.create(name="Jane Austen")
+        author, _ = author_with_books
 
         result = getattr_safe(author, "id")
 
         assert isinstance(result, Success)
         assert result.unwrap() == author.id
+
+
+class TestUnsafePerformIO:
+    def test_unsafe_perform_io_success(self):
+        assert unsafe_perform_io(IOSuccess(1)) == Success(1)
+
+    def test_unsafe_perform_io_failure(self):
+        error = ValueError("boom")
+
+        assert unsafe_perform_io(IOFailure(error)) == Failure(error)
+
+    def test_unsafe_perform_io_does_not_copy(self):
+        io_result = IOSuccess(1)
+
+        assert unsafe_perform_io(io_result) is unsafe_perform_io(io_result)